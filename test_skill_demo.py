@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Demo-environment smoke test for the kalshi CLI.
+
+Runs the read-only subcommands against the Kalshi demo API and echoes
+their output. Commands execute in-process through kalshi.main so the
+suite pays the interpreter and import cost once instead of per command;
+a subprocess fallback covers older CLI versions without a main().
+Credentials come from the environment or a local .env file.
+"""
+
+import functools
+import os
+import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from io import StringIO
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+SKILL_CLI = REPO_ROOT / "kalshi" / "kalshi.py"
+ENV_FILES = [REPO_ROOT / ".env", REPO_ROOT / "kalshi" / ".env"]
+
+# Fallback subprocess argv prefix, built once so per-call construction is
+# a single unpack instead of Path.__str__ plus list concat. --demo is NOT
+# part of the prefix: older CLI parsers discard it ahead of the
+# subcommand, so it must go last or the fallback would hit production
+_CMD_PREFIX = (sys.executable, "-I", str(SKILL_CLI))
+
+sys.path.insert(0, str(SKILL_CLI.parent))
+try:
+    import kalshi as skill
+except ImportError:
+    skill = None
+
+# Serializes run_cmd output so parallel commands don't interleave lines
+_PRINT_LOCK = threading.Lock()
+
+class _ThreadCapture:
+    """
+    Stdout/stderr proxy that routes writes to a per-thread buffer when one
+    is registered, so parallel in-process commands don't mix output.
+    """
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self, buf):
+        self._local.buf = buf
+
+    def release(self):
+        self._local.buf = None
+
+    def write(self, s):
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self._fallback).write(s)
+
+    def flush(self):
+        buf = getattr(self._local, "buf", None)
+        (buf if buf is not None else self._fallback).flush()
+
+_CAPTURE = _ThreadCapture(sys.stdout)
+
+# Matches KEY=value lines with optional quotes and trailing comments; one
+# multiline scan over the raw bytes replaces per-line strip/split work
+_ENV_RE = re.compile(
+    rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*='
+    rb'[ \t]*(?:"([^"]*)"|\'([^\']*)\'|([^\n#]*?))[ \t]*(?:#.*)?$',
+    re.M,
+)
+
+def load_env_files():
+    """Populate os.environ from local .env files without overriding it"""
+    for path in ENV_FILES:
+        # Read directly and let a missing file raise rather than paying a
+        # separate exists() stat for each candidate
+        try:
+            data = path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for m in _ENV_RE.finditer(data):
+            value = m.group(2) or m.group(3) or m.group(4) or b""
+            os.environ.setdefault(m.group(1).decode(), value.decode().rstrip())
+
+def _run_inprocess(args):
+    """Invoke kalshi.main in this interpreter, capturing its output"""
+    if sys.stdout is not _CAPTURE:
+        sys.stdout = sys.stderr = _CAPTURE
+    buf = StringIO()
+    _CAPTURE.capture(buf)
+    try:
+        # Share the demo client so every command reuses its connections
+        # and parsed signing key
+        rc = skill.main(["--demo", *args], client=demo_client()) or 0
+    except SystemExit as exc:
+        rc = exc.code or 0
+    except Exception as exc:
+        buf.write(f"{exc}\n")
+        rc = 1
+    finally:
+        _CAPTURE.release()
+    return rc, buf.getvalue()
+
+def _run_subprocess(args):
+    """Fallback: spawn the CLI when it doesn't expose main()"""
+    # -I skips user-site scanning and sys.path injection at startup (the
+    # CLI still needs site-packages, so -S stays off); the env vars keep
+    # the child from writing .pyc files or scanning user site either
+    cmd = [*_CMD_PREFIX, *args, "--demo"]
+    env = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1", "PYTHONNOUSERSITE": "1"}
+    # Keep the output as bytes; run_cmd writes them straight through
+    # without a decode/strip/re-encode round-trip
+    result = subprocess.run(cmd, capture_output=True, env=env)
+    output = result.stdout
+    if result.stderr:
+        output += result.stderr
+    return result.returncode, output
+
+def run_cmd(args, allow_fail=False):
+    """Run one CLI subcommand against the demo API and echo its output"""
+    if skill is not None and callable(getattr(skill, "main", None)):
+        rc, output = _run_inprocess(args)
+    else:
+        rc, output = _run_subprocess(args)
+    with _PRINT_LOCK:
+        print(f"$ kalshi --demo {' '.join(args)}")
+        if isinstance(output, bytes):
+            # Fallback path: forward the child's bytes unmodified
+            if output:
+                sys.stdout.buffer.write(output)
+                if not output.endswith(b"\n"):
+                    sys.stdout.buffer.write(b"\n")
+        elif output.strip():
+            print(output.strip())
+    if rc != 0 and not allow_fail:
+        raise RuntimeError(f"command failed ({rc}): {' '.join(args)}")
+    return rc
+
+# Shared demo client so library calls reuse one pooled connection and
+# parsed signing key; KalshiClient closes itself at exit. The lock keeps
+# the parallel first bucket from constructing duplicate clients
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+def demo_client():
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = skill.KalshiClient(use_demo=True)
+    return _CLIENT
+
+@functools.lru_cache(maxsize=1)
+def pick_demo_ticker():
+    """Find an open demo market to use for the ticker-dependent checks"""
+    markets = demo_client().request("GET", "/markets", params={"status": "open", "limit": 50})
+    for market in markets.get("markets", []):
+        if market.get("ticker"):
+            return market["ticker"]
+    return None
+
+def check_cache_rules():
+    """Offline guards for cache tiers that must never serve stale data"""
+    if skill is None:
+        return
+    assert skill._cache_ttl("/markets/trades?ticker=X&limit=50") == 0, \
+        "/markets/trades is a live feed and must never be cached"
+    assert skill._cache_ttl("/series/S/markets/T/candlesticks?start_ts=1&end_ts=2") == 0, \
+        "timestamped candlestick windows can never be re-read; don't cache them"
+    assert skill._cache_ttl("/series?category=Crypto&include_volume=true") <= 60, \
+        "volume-bearing series snapshots feed live rankings"
+
+def main():
+    # Credential guard first: only touch the .env files when the
+    # environment is missing something, and exit before any other work if
+    # it still is
+    if not os.environ.get("KALSHI_API_KEY_ID") or not os.environ.get("KALSHI_PRIVATE_KEY"):
+        load_env_files()
+    if not os.environ.get("KALSHI_API_KEY_ID") or not os.environ.get("KALSHI_PRIVATE_KEY"):
+        print("KALSHI_API_KEY_ID / KALSHI_PRIVATE_KEY not set; see .env.example", file=sys.stderr)
+        return 1
+
+    if not SKILL_CLI.exists():
+        print(f"missing CLI at {SKILL_CLI}", file=sys.stderr)
+        return 1
+
+    check_cache_rules()
+
+    try:
+        # Independent read-only checks hitting the demo API; wall time is
+        # network-bound so each bucket runs fully parallel. The
+        # must-succeed bucket aborts the run on the first failure; the
+        # allow-fail bucket never propagates errors
+        must_succeed = [
+            ["account"],
+            ["hot", "--limit", "3"],
+            ["edge", "--p-win", "0.55", "--decimal-odds", "2.1", "--stake", "25",
+             "--opening-odds", "2.0", "--closing-odds", "1.9"],
+        ]
+        allow_fail = [
+            ["hot", "--limit", "3", "--frequency", "daily"],
+            ["hot", "--limit", "2", "--category", "Financials"],
+        ]
+
+        with ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 4) - 2)) as executor:
+            futures = [executor.submit(run_cmd, args) for args in must_succeed]
+            done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                future.cancel()
+            try:
+                for future in done:
+                    future.result()
+            except RuntimeError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+
+            for _ in executor.map(lambda args: run_cmd(args, allow_fail=True), allow_fail):
+                pass
+
+        # The stats check depends on a discovered ticker, so it runs after
+        # the independent batch drains
+        ticker = pick_demo_ticker()
+        if ticker:
+            run_cmd(["stats", "--ticker", ticker, "--series-ticker", ticker.split("-")[0]], allow_fail=True)
+        else:
+            print("no open demo market found; skipping stats check", file=sys.stderr)
+    finally:
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+
+    print("smoke test complete")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())